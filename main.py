@@ -5,26 +5,153 @@ import random
 import re
 import time
 import traceback
-from typing import Any, Dict, List
+import hashlib
+import io
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Set
 
 # Consolidated PyQt5 imports.
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame,
     QPushButton, QSizePolicy, QLabel, QListWidget, QListWidgetItem, QMenu,
-    QLineEdit, QFileDialog, QMessageBox, QStatusBar, QAction, QFormLayout,
-    QCheckBox, QDockWidget, QPlainTextEdit, QTableWidget, QTableWidgetItem,
-    QInputDialog, QProgressDialog, QAbstractItemView
+    QLineEdit, QFileDialog, QMessageBox, QStatusBar, QAction, QDockWidget,
+    QPlainTextEdit, QTableView, QInputDialog, QProgressDialog, QAbstractItemView,
+    QDialog
+)
+from PyQt5.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, QSize, QAbstractTableModel, QModelIndex, QMutex,
+    QWaitCondition, QSignalBlocker
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
 from PyQt5.QtGui import QFontMetrics, QIcon
 
-import qtmodern.styles
-import qtmodern.windows
-
 # Constants for file names.
+SEANIM_EXT = ".seanim"
 CONFIG_FILE = "config.json"
+CONFIG_PACK_FILE = "config.cfg"
 MAPPING_FILE = "additive_mappings.json"
 
+# Log dock limits: maximum retained lines and how often queued messages are shown.
+LOG_MAX_BLOCKS = 2000
+LOG_FLUSH_INTERVAL_MS = 100
+
+# Minimum time in seconds between log signals sent by the project worker.
+LOG_EMIT_INTERVAL = 0.05
+
+# Append-only log of config changes, replayed over CONFIG_FILE on startup.
+CONFIG_LOG_FILE = "config.log"
+
+# Delay before pending config changes are written to disk.
+CONFIG_SAVE_DELAY_MS = 300
+
+# Project file output is flushed to disk in chunks of at least this many bytes.
+PROJECT_WRITE_CHUNK = 64 * 1024
+
+# Number of parsed JSON files ConfigManager keeps in memory.
+PARSED_CACHE_SIZE = 16
+
+# orjson is optional; the standard library json module is used when it is missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional; without it the config snapshot stays in JSON.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Config and mapping files are written compactly unless pretty output is requested.
+PRETTY_JSON = bool(os.environ.get("ALCHEMIST_PRETTY_JSON"))
+
+# Shared encoders for the stdlib fallback; json.dumps with custom options would
+# build a new JSONEncoder on every call.
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize obj for the config/mapping files (compact unless PRETTY_JSON)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+    if PRETTY_JSON:
+        return PRETTY_JSON_ENCODER.encode(obj).encode("utf-8")
+    return COMPACT_JSON_ENCODER.encode(obj).encode("utf-8")
+
+
+def dump_config(config: Dict[str, Any]) -> bytes:
+    """Serialize the config snapshot (MessagePack when available, else JSON)."""
+    if msgpack is not None:
+        return msgpack.packb(config, use_bin_type=True)
+    return dump_json(config)
+
+
+def dump_json_compact(obj: Any) -> bytes:
+    """Serialize obj as compact JSON bytes, as used for the project file."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return COMPACT_JSON_ENCODER.encode(obj).encode("utf-8")
+
+
+def file_stem(path: str) -> str:
+    """Return the file name of path without its extension.
+
+    Animation files almost always end in .seanim, so that suffix is stripped
+    directly instead of going through os.path.splitext.
+    """
+    name = os.path.basename(path)
+    if name.endswith(SEANIM_EXT) and len(name) > len(SEANIM_EXT):
+        return name[:-len(SEANIM_EXT)]
+    return os.path.splitext(name)[0]
+
+
+def existing_files(paths: Iterable[str]) -> Set[str]:
+    """Return the given paths that exist.
+
+    Paths sharing a parent directory are checked with a single os.scandir of that
+    directory instead of one stat per path.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    found: Set[str] = set()
+    for directory, dir_paths in by_dir.items():
+        if len(dir_paths) == 1:
+            if os.path.exists(dir_paths[0]):
+                found.add(dir_paths[0])
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            continue
+        found.update(p for p in dir_paths if os.path.normcase(os.path.basename(p)) in names)
+    return found
+
+
+def write_fd(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a temporary file, so a crash never leaves it truncated."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_json(data: bytes) -> Any:
+    """Parse the raw bytes of a config/mapping file."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Default values for animation file settings.
 DEFAULT_SETTINGS: Dict[str, Any] = {
     "OutputFramerate": 30,
@@ -57,67 +184,361 @@ DEFAULT_MAPPING: Dict[str, Any] = {
     "crawl_r": ["crawl_r", 1]
 }
 
+# Constant part of every project file. The IK target bone names (None here) are
+# filled in per project, and "Animations" must stay the last key since the
+# animation entries are streamed into its empty "$values" list.
+PROJECT_TEMPLATE: Dict[str, Any] = {
+    "$id": "1",
+    "EnableAnimationTrimming": False,
+    "LeftIKStartBoneName": "j_shoulder_le",
+    "LeftIKMidBoneName": "j_elbow_le",
+    "LeftIKEndBoneName": "j_wrist_le",
+    "LeftIKTargetBoneName": None,
+    "RightIKStartBoneName": "j_shoulder_ri",
+    "RightIKMidBoneName": "j_elbow_ri",
+    "RightIKEndBoneName": "j_wrist_ri",
+    "RightIKTargetBoneName": None,
+    "OutputPrefix": "",
+    "OutputSuffix": "",
+    "OutputFormat": ".seanim",
+    "Animations": {
+        "$id": "2",
+        "$values": []
+    }
+}
+
+
+###############################################################################
+# Background Saver
+###############################################################################
+class ConfigSaver(QThread):
+    """Writes config/mapping files off the GUI thread, coalescing rapid saves.
+
+    Only the latest state submitted for each path is kept, so several saves made
+    before the thread wakes up result in a single write.
+    """
+    def __init__(self, parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._condition = QWaitCondition()
+        self._pending: Dict[str, Any] = {}
+        self._stopping = False
+
+    def submit(self, path: str, state: Any) -> None:
+        self._mutex.lock()
+        try:
+            self._pending[path] = state
+            self._condition.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self) -> None:
+        """Write any pending state and stop the thread."""
+        self._mutex.lock()
+        try:
+            self._stopping = True
+            self._condition.wakeOne()
+        finally:
+            self._mutex.unlock()
+        self.wait()
+
+    def run(self) -> None:
+        while True:
+            self._mutex.lock()
+            try:
+                while not self._pending and not self._stopping:
+                    self._condition.wait(self._mutex)
+                pending, self._pending = self._pending, {}
+                stopping = self._stopping
+            finally:
+                self._mutex.unlock()
+            for path, state in pending.items():
+                self.write(path, state)
+            if stopping:
+                return
+
+    @staticmethod
+    def write(path: str, state: Any) -> None:
+        try:
+            write_file_atomic(path, dump_json(state))
+        except Exception as e:
+            print(f"Error saving {path}: {e}")
+
 
 ###############################################################################
 # Configuration Manager (Model)
 ###############################################################################
 class ConfigManager:
     """Handles loading and saving of configuration and mapping files."""
-    def __init__(self, config_file: str = CONFIG_FILE, mapping_file: str = MAPPING_FILE) -> None:
+    def __init__(self, config_file: str = CONFIG_FILE, mapping_file: str = MAPPING_FILE,
+                 config_log_file: str = CONFIG_LOG_FILE, config_pack_file: str = CONFIG_PACK_FILE) -> None:
         self.config_file = config_file
         self.mapping_file = mapping_file
+        self.config_log_file = config_log_file
+        self.config_pack_file = config_pack_file
+        # The config snapshot is stored as MessagePack when msgpack is installed, and
+        # as JSON (config_file) otherwise.
+        self.snapshot_file = config_pack_file if msgpack is not None else config_file
         self.config: Dict[str, Any] = {}
         self.mappings: Dict[str, Any] = {}
+        # Parsed file contents keyed by a hash of the raw bytes (small LRU).
+        self._parsed_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._saver = ConfigSaver()
+        self._saver.start()
+        # Config changes are batched: record_change() queues the change and restarts
+        # this timer, and the queued changes are appended to the log once they settle.
+        self._pending_changes: Dict[str, Any] = {}
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_config)
         self.load_all()
 
+    def close(self) -> None:
+        """Flush pending saves and stop the background saver."""
+        self._save_timer.stop()
+        self.flush_config()
+        self._saver.stop()
+
+    def record_change(self, key: str, value: Any) -> None:
+        """Apply a config change and schedule it to be appended to the change log."""
+        self.config[key] = value
+        # Only the latest value per key needs to reach the log.
+        self._pending_changes[key] = value
+        self._save_timer.start()
+
+    def discard_pending_changes(self) -> None:
+        self._save_timer.stop()
+        self._pending_changes.clear()
+
+    def flush_config(self) -> None:
+        """Append queued config changes to the change log in a single write."""
+        if not self._pending_changes:
+            return
+        data = b"".join(dump_json_compact({"k": key, "v": value}) + b"\n"
+                        for key, value in self._pending_changes.items())
+        self._pending_changes.clear()
+        try:
+            with open(self.config_log_file, "a+b") as f:
+                # Terminate a torn record left by an interrupted append, so it does
+                # not swallow the first record written here.
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+
     def load_all(self) -> None:
         self.load_config()
         self.load_mappings()
 
+    def read_json(self, path: str) -> Any:
+        """Load a JSON file, reusing the parsed result if its contents were seen before.
+
+        Dicts are returned as a top-level copy so callers can add and remove keys;
+        nested values are shared with the cache and must not be mutated in place.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest in self._parsed_cache:
+            self._parsed_cache.move_to_end(digest)
+            result = self._parsed_cache[digest]
+        else:
+            result = load_json(data)
+            self._parsed_cache[digest] = result
+            if len(self._parsed_cache) > PARSED_CACHE_SIZE:
+                self._parsed_cache.popitem(last=False)
+        return dict(result) if isinstance(result, dict) else result
+
     def load_config(self) -> None:
+        """Load the config snapshot, then replay the change log on top of it."""
+        migrate_json = False
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    self.config = json.load(f)
+            if msgpack is not None:
+                self.config = {}
+                if os.path.exists(self.config_pack_file):
+                    with open(self.config_pack_file, "rb") as f:
+                        self.config = msgpack.unpackb(f.read(), raw=False)
+                if os.path.exists(self.config_file):
+                    # config.json is removed once converted, so if it exists it was
+                    # written while msgpack was unavailable and its values are newer.
+                    self.config.update(self.read_json(self.config_file))
+                    migrate_json = True
+            elif os.path.exists(self.config_file):
+                self.config = self.read_json(self.config_file)
             else:
                 self.config = {}
+                if os.path.exists(self.config_pack_file):
+                    # config.cfg is left in place and merged back once msgpack is installed.
+                    print(f"{self.config_pack_file} requires msgpack; its settings are not loaded.")
         except Exception as e:
             self.config = {}
             print(f"Error loading config: {e}")
-
-    def save_config(self) -> None:
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
+            if os.path.exists(self.config_log_file):
+                self._replay_config_log()
+            if migrate_json:
+                self.compact_config()
+                os.remove(self.config_file)
         except Exception as e:
-            print(f"Error saving config: {e}")
+            print(f"Error loading config log: {e}")
+
+    def _replay_config_log(self) -> None:
+        with open(self.config_log_file, "rb") as f:
+            lines = f.read().splitlines()
+        for line in lines:
+            try:
+                change = load_json(line)
+            except ValueError:
+                # A partially written record from an interrupted append.
+                continue
+            self.config[change["k"]] = change["v"]
+        snapshot_size = os.path.getsize(self.snapshot_file) if os.path.exists(self.snapshot_file) else 0
+        if os.path.getsize(self.config_log_file) > snapshot_size:
+            self.compact_config()
+
+    def compact_config(self) -> None:
+        """Fold the change log into the snapshot file and truncate the log."""
+        write_file_atomic(self.snapshot_file, dump_config(self.config))
+        open(self.config_log_file, "wb").close()
+
+    def export_config(self, path: str) -> None:
+        """Write the current config to path as JSON."""
+        write_file_atomic(path, dump_json(self.config))
 
     def load_mappings(self) -> None:
         try:
             if os.path.exists(self.mapping_file):
-                with open(self.mapping_file, "r") as f:
-                    self.mappings = json.load(f)
+                self.mappings = self.read_json(self.mapping_file)
             else:
                 self.mappings = DEFAULT_MAPPING.copy()
-                with open(self.mapping_file, "w") as f:
-                    json.dump(self.mappings, f, indent=4)
+                self.save_mappings()
         except Exception as e:
             self.mappings = {}
             print(f"Error loading mappings: {e}")
 
     def save_mappings(self) -> None:
+        self._saver.submit(self.mapping_file, dict(self.mappings))
+
+
+###############################################################################
+# Mapping Table Model (Model for Mapping Management)
+###############################################################################
+def parse_mapping_values(text: str) -> List[Any]:
+    """Convert a comma-separated values string into a mapping value list."""
+    value_list: List[Any] = []
+    for part in text.split(","):
+        part = part.strip()
         try:
-            with open(self.mapping_file, "w") as f:
-                json.dump(self.mappings, f, indent=4)
-        except Exception as e:
-            print(f"Error saving mappings: {e}")
+            value_list.append(int(part))
+        except ValueError:
+            value_list.append(part)
+    return value_list
+
+
+class MappingModel(QAbstractTableModel):
+    """Table model exposing the mapping entries lazily to a QTableView."""
+    HEADERS = ["Key", "Values (comma-separated)"]
+
+    def __init__(self, config_manager: ConfigManager, parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self._keys: List[str] = []
+        self._vals: List[Any] = []
+        self._sync()
+
+    def _sync(self) -> None:
+        mappings = self.config_manager.mappings
+        self._keys = list(mappings.keys())
+        self._vals = list(mappings.values())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row = index.row()
+        if index.column() == 0:
+            return self._keys[row]
+        return ",".join(map(str, self._vals[row]))
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> int:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole or not value:
+            return False
+        row = index.row()
+        if index.column() == 0:
+            self.update_entry(row, str(value), self._vals[row])
+        else:
+            self.update_entry(row, self._keys[row], parse_mapping_values(str(value)))
+        self.config_manager.save_mappings()
+        return True
+
+    def key_at(self, row: int) -> str:
+        return self._keys[row]
+
+    def add_entry(self, key: str, values: List[Any]) -> None:
+        """Insert a new mapping, or update it in place if the key already exists."""
+        if key in self.config_manager.mappings:
+            self.update_entry(self._keys.index(key), key, values)
+            return
+        row = len(self._keys)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.config_manager.mappings[key] = values
+        self._keys.append(key)
+        self._vals.append(values)
+        self.endInsertRows()
+
+    def update_entry(self, row: int, key: str, values: List[Any]) -> None:
+        old_key = self._keys[row]
+        if key != old_key:
+            # Renaming changes the dict order (and may collide with an existing key),
+            # so resynchronize the whole view from the mappings.
+            self.beginResetModel()
+            del self.config_manager.mappings[old_key]
+            self.config_manager.mappings[key] = values
+            self._sync()
+            self.endResetModel()
+            return
+        self.config_manager.mappings[key] = values
+        self._vals[row] = values
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 1))
+
+    def remove_entry(self, row: int) -> str:
+        key = self._keys[row]
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.config_manager.mappings[key]
+        del self._keys[row]
+        del self._vals[row]
+        self.endRemoveRows()
+        return key
+
+    def reload(self) -> None:
+        """Resynchronize the model after bulk changes to the mappings (e.g. import)."""
+        self.beginResetModel()
+        self._sync()
+        self.endResetModel()
 
 
 ###############################################################################
 # Mapping Editor Dialog (View for Mapping Management)
 ###############################################################################
-from PyQt5.QtWidgets import QDialog  # Imported here since this view is separate.
-
 class MappingEditorDialog(QDialog):
     """Dialog for editing animation mapping entries."""
     def __init__(self, config_manager: ConfigManager, parent: QWidget = None) -> None:
@@ -128,11 +549,10 @@ class MappingEditorDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Table for mappings.
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Key", "Values (comma-separated)"])
+        self.model = MappingModel(config_manager, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         layout.addWidget(self.table)
-        self.load_table()
 
         # Buttons for CRUD operations.
         button_layout = QHBoxLayout()
@@ -162,70 +582,38 @@ class MappingEditorDialog(QDialog):
         self.import_button.setToolTip("Import mappings from a JSON file.")
         self.export_button.setToolTip("Export current mappings to a JSON file.")
 
-    def load_table(self) -> None:
-        self.table.setRowCount(0)
-        for key, value in self.config_manager.mappings.items():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            key_item = QTableWidgetItem(key)
-            value_str = ",".join(str(v) for v in value)
-            value_item = QTableWidgetItem(value_str)
-            self.table.setItem(row, 0, key_item)
-            self.table.setItem(row, 1, value_item)
-
     def add_entry(self) -> None:
         key, ok = QInputDialog.getText(self, "Add Mapping", "Enter mapping key (comma-separated fragments):")
         if ok and key:
             values, ok_val = QInputDialog.getText(self, "Add Mapping", "Enter mapping values (comma-separated):")
             if ok_val and values:
-                value_list: List[Any] = []
-                for part in values.split(","):
-                    part = part.strip()
-                    try:
-                        value_list.append(int(part))
-                    except ValueError:
-                        value_list.append(part)
-                self.config_manager.mappings[key] = value_list
+                value_list = parse_mapping_values(values)
+                self.model.add_entry(key, value_list)
                 self.config_manager.save_mappings()
-                self.load_table()
                 if self.parent() is not None and hasattr(self.parent(), 'log_message'):
                     self.parent().log_message(f"Mapping added: {key} -> {value_list}")
 
     def edit_entry(self) -> None:
-        current_item = self.table.currentItem()
-        if current_item:
-            row = current_item.row()
-            key_item = self.table.item(row, 0)
-            value_item = self.table.item(row, 1)
-            key = key_item.text()
+        index = self.table.currentIndex()
+        if index.isValid():
+            row = index.row()
+            key = self.model.key_at(row)
+            values_text = self.model.data(self.model.index(row, 1))
             new_key, ok = QInputDialog.getText(self, "Edit Mapping", "Edit mapping key:", text=key)
             if ok and new_key:
-                new_values, ok_val = QInputDialog.getText(self, "Edit Mapping", "Edit mapping values (comma-separated):", text=value_item.text())
+                new_values, ok_val = QInputDialog.getText(self, "Edit Mapping", "Edit mapping values (comma-separated):", text=values_text)
                 if ok_val and new_values:
-                    value_list = []
-                    for part in new_values.split(","):
-                        part = part.strip()
-                        try:
-                            value_list.append(int(part))
-                        except ValueError:
-                            value_list.append(part)
-                    if new_key != key:
-                        del self.config_manager.mappings[key]
-                    self.config_manager.mappings[new_key] = value_list
+                    value_list = parse_mapping_values(new_values)
+                    self.model.update_entry(row, new_key, value_list)
                     self.config_manager.save_mappings()
-                    self.load_table()
                     if self.parent() is not None and hasattr(self.parent(), 'log_message'):
                         self.parent().log_message(f"Mapping edited: {new_key} -> {value_list}")
 
     def remove_entry(self) -> None:
-        current_item = self.table.currentItem()
-        if current_item:
-            row = current_item.row()
-            key_item = self.table.item(row, 0)
-            key = key_item.text()
-            del self.config_manager.mappings[key]
+        index = self.table.currentIndex()
+        if index.isValid():
+            key = self.model.remove_entry(index.row())
             self.config_manager.save_mappings()
-            self.load_table()
             if self.parent() is not None and hasattr(self.parent(), 'log_message'):
                 self.parent().log_message(f"Mapping removed: {key}")
 
@@ -233,11 +621,10 @@ class MappingEditorDialog(QDialog):
         fname, _ = QFileDialog.getOpenFileName(self, "Import Mappings", "", "JSON Files (*.json)")
         if fname:
             try:
-                with open(fname, "r") as f:
-                    imported = json.load(f)
+                imported = self.config_manager.read_json(fname)
                 self.config_manager.mappings.update(imported)
                 self.config_manager.save_mappings()
-                self.load_table()
+                self.model.reload()
                 if self.parent() is not None and hasattr(self.parent(), 'log_message'):
                     self.parent().log_message(f"Imported mappings from: {fname}")
             except Exception as e:
@@ -247,8 +634,7 @@ class MappingEditorDialog(QDialog):
         fname, _ = QFileDialog.getSaveFileName(self, "Export Mappings", "", "JSON Files (*.json)")
         if fname:
             try:
-                with open(fname, "w") as f:
-                    json.dump(self.config_manager.mappings, f, indent=4)
+                write_file_atomic(fname, dump_json(self.config_manager.mappings))
                 if self.parent() is not None and hasattr(self.parent(), 'log_message'):
                     self.parent().log_message(f"Exported mappings to: {fname}")
             except Exception as e:
@@ -260,27 +646,32 @@ class MappingEditorDialog(QDialog):
 ###############################################################################
 class DragDropBox(QFrame):
     """A drop area for single file types (e.g., idle, left pose, skeleton, etc.)."""
+    # Shared by every instance so the stylesheet text is built only once.
+    _STYLE = """
+        QFrame {
+            background-color: #1e1e1e;
+            border: 1px dashed #555;
+            border-radius: 6px;
+        }
+        QLabel {
+            color: #888;
+            font-size: 10pt;
+        }
+    """
+
     def __init__(self, filetype: str, config_key: str, update_callback, placeholder: str = "") -> None:
         super().__init__()
         self.setAcceptDrops(True)
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border: 1px dashed #555;
-                border-radius: 6px;
-            }
-            QLabel {
-                color: #888;
-                font-size: 10pt;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumSize(120, 50)
         self.filetype = filetype
         self.config_key = config_key
         self.update_callback = update_callback
         self.placeholder = placeholder
+        self._metrics = None
+        self._metrics_font = None
 
         self.filename_label = QLabel("")
         self.filename_label.setAlignment(Qt.AlignCenter)
@@ -315,38 +706,51 @@ class DragDropBox(QFrame):
                 if hasattr(self.window(), 'log_message'):
                     self.window().log_message(f"Invalid file dropped: {filepath} (expected .{self.filetype})")
 
+    def _font_metrics(self) -> QFontMetrics:
+        # The label's font can change after construction (e.g. when the stylesheet is
+        # polished), so the cached metrics are keyed on the font they were built from.
+        font = self.filename_label.font()
+        if self._metrics is None or font != self._metrics_font:
+            self._metrics = QFontMetrics(font)
+            self._metrics_font = font
+        return self._metrics
+
     def set_filename_display(self, name: str) -> None:
-        metrics = QFontMetrics(self.filename_label.font())
-        elided = metrics.elidedText(name, Qt.ElideMiddle, self.width() - 20)
+        elided = self._font_metrics().elidedText(name, Qt.ElideMiddle, self.width() - 20)
         self.filename_label.setText(elided)
 
 
 class AnimationDropArea(QFrame):
     """A drop area for additive animations with internal reordering support."""
+    _STYLE = """
+        QFrame {
+            background-color: #1e1e1e;
+            border: 1px dashed #555;
+            border-radius: 6px;
+        }
+        QListWidget {
+            background-color: #1e1e1e;
+            color: #ccc;
+            border: none;
+        }
+        QListWidget::item:hover {
+            background-color: #333333;
+        }
+        QListWidget::item:selected {
+            background-color: #555555;
+        }
+    """
+
     def __init__(self, update_callback, initial_files: List[str] = None) -> None:
         super().__init__()
         self.setAcceptDrops(True)
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border: 1e1e1e dashed #555;
-                border-radius: 6px;
-            }
-            QListWidget {
-                background-color: #1e1e1e;
-                color: #ccc;
-                border: none;
-            }
-            QListWidget::item:hover {
-                background-color: #333333;
-            }
-            QListWidget::item:selected {
-                background-color: #555555;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
         self.setMinimumHeight(120)
         self.update_callback = update_callback
+        # Paths already in the list, for O(1) duplicate checks on drop.
+        self._paths: Set[str] = set()
+        self._main_app = None
         self.list_widget = QListWidget()
         self.list_widget.setStyleSheet("padding: 5px;")
         self.list_widget.setSelectionMode(QListWidget.ExtendedSelection)
@@ -363,8 +767,14 @@ class AnimationDropArea(QFrame):
             for f in initial_files:
                 self.add_file(f)
 
+    def _get_main_app(self) -> "AlchemistAdditiveApp":
+        """Resolve the main window once instead of walking the widget tree per click."""
+        if self._main_app is None:
+            self._main_app = self.window().findChild(AlchemistAdditiveApp)
+        return self._main_app
+
     def on_item_clicked(self, item: QListWidgetItem) -> None:
-        main_app = self.window().findChild(AlchemistAdditiveApp)
+        main_app = self._get_main_app()
         if main_app:
             main_app.on_animation_item_clicked(item.toolTip())
 
@@ -374,21 +784,41 @@ class AnimationDropArea(QFrame):
 
     def dropEvent(self, event) -> None:
         files = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path.endswith(".seanim"):
-                self.add_file(path)
-                files.append(path)
+        self._begin_bulk_update()
+        try:
+            for url in event.mimeData().urls():
+                path = url.toLocalFile()
+                if path.endswith(".seanim"):
+                    self.add_file(path)
+                    files.append(path)
+        finally:
+            self._end_bulk_update()
         if files:
             self.update_callback("animations", self.get_all_files())
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message(f"Added additive animations: {files}")
 
     def add_file(self, path: str) -> None:
-        if path not in self.get_all_files():
-            item = QListWidgetItem(os.path.basename(path))
-            item.setToolTip(path)
-            self.list_widget.addItem(item)
+        if path in self._paths:
+            return
+        self._paths.add(path)
+        item = QListWidgetItem(os.path.basename(path))
+        item.setToolTip(path)
+        self.list_widget.addItem(item)
+
+    def clear_files(self) -> None:
+        self.list_widget.clear()
+        self._paths.clear()
+
+    def _begin_bulk_update(self) -> None:
+        """Suspend repaints and signals while many items are added or removed."""
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+
+    def _end_bulk_update(self) -> None:
+        self.list_widget.blockSignals(False)
+        self.list_widget.setUpdatesEnabled(True)
+        self.list_widget.viewport().update()
 
     def get_all_files(self) -> List[str]:
         return [self.list_widget.item(i).toolTip() for i in range(self.list_widget.count())]
@@ -402,14 +832,20 @@ class AnimationDropArea(QFrame):
         clear_action = menu.addAction("Clear All")
         action = menu.exec_(self.list_widget.mapToGlobal(position))
         if action == remove_action:
-            for item in selected_items:
-                row = self.list_widget.row(item)
-                self.list_widget.takeItem(row)
+            # Take rows bottom-up so earlier removals don't shift the remaining rows.
+            rows = sorted((self.list_widget.row(item) for item in selected_items), reverse=True)
+            self._begin_bulk_update()
+            try:
+                for row in rows:
+                    item = self.list_widget.takeItem(row)
+                    self._paths.discard(item.toolTip())
+            finally:
+                self._end_bulk_update()
             self.update_callback("animations", self.get_all_files())
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message("Removed selected additive animations.")
         elif action == clear_action:
-            self.list_widget.clear()
+            self.clear_files()
             self.update_callback("animations", [])
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message("Cleared all additive animations.")
@@ -417,30 +853,18 @@ class AnimationDropArea(QFrame):
 
 class NormalAnimationDropArea(QFrame):
     """A drop area for normal animations with drag and drop reordering."""
+    _STYLE = AnimationDropArea._STYLE
+
     def __init__(self, update_callback, initial_files: List[str] = None) -> None:
         super().__init__()
         self.setAcceptDrops(True)
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border: 1e1e1e dashed #555;
-                border-radius: 6px;
-            }
-            QListWidget {
-                background-color: #1e1e1e;
-                color: #ccc;
-                border: none;
-            }
-            QListWidget::item:hover {
-                background-color: #333333;
-            }
-            QListWidget::item:selected {
-                background-color: #555555;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
         self.setMinimumHeight(120)
         self.update_callback = update_callback
+        # Paths already in the list, for O(1) duplicate checks on drop.
+        self._paths: Set[str] = set()
+        self._main_app = None
         self.list_widget = QListWidget()
         self.list_widget.setStyleSheet("padding: 5px;")
         self.list_widget.setSelectionMode(QListWidget.ExtendedSelection)
@@ -457,8 +881,14 @@ class NormalAnimationDropArea(QFrame):
             for f in initial_files:
                 self.add_file(f)
 
+    def _get_main_app(self) -> "AlchemistAdditiveApp":
+        """Resolve the main window once instead of walking the widget tree per click."""
+        if self._main_app is None:
+            self._main_app = self.window().findChild(AlchemistAdditiveApp)
+        return self._main_app
+
     def on_item_clicked(self, item: QListWidgetItem) -> None:
-        main_app = self.window().findChild(AlchemistAdditiveApp)
+        main_app = self._get_main_app()
         if main_app:
             main_app.on_animation_item_clicked(item.toolTip())
 
@@ -468,20 +898,40 @@ class NormalAnimationDropArea(QFrame):
 
     def dropEvent(self, event) -> None:
         files = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            self.add_file(path)
-            files.append(path)
+        self._begin_bulk_update()
+        try:
+            for url in event.mimeData().urls():
+                path = url.toLocalFile()
+                self.add_file(path)
+                files.append(path)
+        finally:
+            self._end_bulk_update()
         if files:
             self.update_callback("normal_anims", self.get_all_files())
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message(f"Added normal animations: {files}")
 
     def add_file(self, path: str) -> None:
-        if path not in self.get_all_files():
-            item = QListWidgetItem(os.path.basename(path))
-            item.setToolTip(path)
-            self.list_widget.addItem(item)
+        if path in self._paths:
+            return
+        self._paths.add(path)
+        item = QListWidgetItem(os.path.basename(path))
+        item.setToolTip(path)
+        self.list_widget.addItem(item)
+
+    def clear_files(self) -> None:
+        self.list_widget.clear()
+        self._paths.clear()
+
+    def _begin_bulk_update(self) -> None:
+        """Suspend repaints and signals while many items are added or removed."""
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+
+    def _end_bulk_update(self) -> None:
+        self.list_widget.blockSignals(False)
+        self.list_widget.setUpdatesEnabled(True)
+        self.list_widget.viewport().update()
 
     def get_all_files(self) -> List[str]:
         return [self.list_widget.item(i).toolTip() for i in range(self.list_widget.count())]
@@ -495,14 +945,20 @@ class NormalAnimationDropArea(QFrame):
         clear_action = menu.addAction("Clear All")
         action = menu.exec_(self.list_widget.mapToGlobal(position))
         if action == remove_action:
-            for item in selected_items:
-                row = self.list_widget.row(item)
-                self.list_widget.takeItem(row)
+            # Take rows bottom-up so earlier removals don't shift the remaining rows.
+            rows = sorted((self.list_widget.row(item) for item in selected_items), reverse=True)
+            self._begin_bulk_update()
+            try:
+                for row in rows:
+                    item = self.list_widget.takeItem(row)
+                    self._paths.discard(item.toolTip())
+            finally:
+                self._end_bulk_update()
             self.update_callback("normal_anims", self.get_all_files())
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message("Removed selected normal animations.")
         elif action == clear_action:
-            self.list_widget.clear()
+            self.clear_files()
             self.update_callback("normal_anims", [])
             if hasattr(self.window(), 'log_message'):
                 self.window().log_message("Cleared all normal animations.")
@@ -542,6 +998,45 @@ class OutputPathSelector(QWidget):
 ###############################################################################
 # Project Creator Worker (Controller)
 ###############################################################################
+def iter_normal_entries(normal_anims: List[str], file_settings: Dict[str, Any], idle: str,
+                        output_path: str, skel: str, left: str, right: str, global_left: str,
+                        global_right: str, start_id: int, randrange) -> Iterator[Dict[str, Any]]:
+    """Yield the project entry for each normal animation, in order.
+
+    Each entry uses three ids (entry, layers, layer) starting at start_id. Everything
+    the loop needs is passed in, so the body only touches fast locals.
+    """
+    for entry_num, norm_anim in zip(itertools.count(start_id, 3), normal_anims):
+        settings = file_settings.get(norm_anim, DEFAULT_SETTINGS)
+        entry_id = str(entry_num)
+        yield {
+            "$id": entry_id,
+            "OutputFramerate": settings["OutputFramerate"],
+            "Name": idle,
+            "OutputName": file_stem(norm_anim),
+            "OutputFolder": output_path,
+            "SkeletonPath": skel,
+            "EnableLeftHandIK": settings["EnableLeftHandIK"],
+            "EnableRightHandIK": settings["EnableRightHandIK"],
+            "UseExperimentalFeatures": settings["UseExperimentalFeatures"],
+            "LeftHandPoseFile": left,
+            "RightHandPoseFile": right,
+            "LeftIKTargetBoneName": global_left or settings["LeftIKTargetBoneName"],
+            "RightIKTargetBoneName": global_right or settings["RightIKTargetBoneName"],
+            "Layers": {
+                "$id": str(entry_num + 1),
+                "$values": [{
+                    "$id": str(entry_num + 2),
+                    "Owner": {"$ref": entry_id},
+                    "Name": norm_anim,
+                    "Offset": None,
+                    "Color": randrange(10000000, 100000000),
+                    "Type": 0
+                }]
+            }
+        }
+
+
 class ProjectCreator(QThread):
     """Worker thread to create the project file without freezing the UI."""
     progress_changed = pyqtSignal(int)
@@ -549,192 +1044,260 @@ class ProjectCreator(QThread):
     project_created = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
+    # Output folders already created by an earlier run in this session.
+    _ensured_dirs: Set[str] = set()
+
     def __init__(self, config: Dict[str, Any], mappings: Dict[str, Any], parent: QWidget = None) -> None:
         super().__init__(parent)
         self.config = config
         self.mappings = mappings
+        self._pending_logs: List[str] = []
+        self._last_log_emit = 0.0
+
+    def _emit_log(self, message: str) -> None:
+        """Queue a log message, emitting queued messages at most every LOG_EMIT_INTERVAL."""
+        self._pending_logs.append(message)
+        now = time.monotonic()
+        if now - self._last_log_emit >= LOG_EMIT_INTERVAL:
+            self._flush_log()
+            self._last_log_emit = now
+
+    def _flush_log(self) -> None:
+        if self._pending_logs:
+            self.log_message.emit("\n".join(self._pending_logs))
+            self._pending_logs.clear()
 
     def run(self) -> None:
         try:
-            self.log_message.emit("Starting project file creation...")
-            self.progress_changed.emit(10)
+            # Attributes and helpers used inside the loops are bound to locals once.
+            config = self.config
+            mappings = self.mappings
+            log = self._emit_log
+            emit_progress = self.progress_changed.emit
+            _basename = os.path.basename
+
+            log("Starting project file creation...")
+            emit_progress(10)
 
             # Retrieve required file paths from configuration.
-            idle = self.config.get("idle_anim")
-            left = self.config.get("left_pose")
-            right = self.config.get("right_pose")
-            skel = self.config.get("skeleton")
-            anims = self.config.get("animations", [])
-            normal_anims = self.config.get("normal_anims", [])
-            output_path = self.config.get("output_path")
+            idle = config.get("idle_anim")
+            left = config.get("left_pose")
+            right = config.get("right_pose")
+            skel = config.get("skeleton")
+            anims = config.get("animations", [])
+            normal_anims = config.get("normal_anims", [])
+            output_path = config.get("output_path")
 
             # Global IK override values.
-            global_left = self.config.get("LeftIKTargetBoneName", "").strip()
-            global_right = self.config.get("RightIKTargetBoneName", "").strip()
+            global_left = config.get("LeftIKTargetBoneName", "").strip()
+            global_right = config.get("RightIKTargetBoneName", "").strip()
 
             if not all([idle, left, right, skel, output_path]):
+                log("Error: Missing required files or output path.")
+                self._flush_log()
                 self.error_occurred.emit("Missing one or more required files or output path.")
-                self.log_message.emit("Error: Missing required files or output path.")
                 return
 
-            anim_entries = []
             id_counter = 3
-            idle_settings = self.config.get("file_settings", {}).get(idle, DEFAULT_SETTINGS.copy())
-            self.log_message.emit(f"Idle settings loaded: {idle_settings}")
-
-            # Process mappings for additive animations.
-            for map_key, values in self.mappings.items():
-                output_name = values[0]
-                types = values[1:]
-                fragments = map_key.split(",")
-                layer_anims = []
-                found_all = True
-
-                for frag in fragments:
-                    matched = [a for a in anims if frag in os.path.basename(a)]
-                    if matched:
-                        layer_anims.append(matched[0])
-                    else:
-                        found_all = False
-                        break
-
-                if not found_all:
-                    continue
-
-                base_name = os.path.basename(idle)
-                final_name = os.path.splitext(base_name)[0].rsplit("_", 1)[0] + f"_{output_name}"
-                entry_id = str(id_counter)
-                layer_id = str(id_counter + 1)
-
-                layer_values = []
-                for idx, anim_path in enumerate(layer_anims):
-                    settings = self.config.get("file_settings", {}).get(anim_path, DEFAULT_SETTINGS.copy())
-                    layer_values.append({
-                        "$id": str(id_counter + 2 + idx),
-                        "Owner": {"$ref": entry_id},
-                        "Name": anim_path,
-                        "Offset": None,
-                        "Color": random.randint(10000000, 99999999),
-                        "Type": types[idx] if idx < len(types) else types[-1]
-                    })
-
-                anim_entries.append({
-                    "$id": entry_id,
-                    "OutputFramerate": idle_settings["OutputFramerate"],
-                    "Name": idle,
-                    "OutputName": final_name,
-                    "OutputFolder": output_path,
-                    "SkeletonPath": skel,
-                    "EnableLeftHandIK": idle_settings["EnableLeftHandIK"],
-                    "EnableRightHandIK": idle_settings["EnableRightHandIK"],
-                    "UseExperimentalFeatures": idle_settings["UseExperimentalFeatures"],
-                    "LeftHandPoseFile": left,
-                    "RightHandPoseFile": right,
-                    "LeftIKTargetBoneName": global_left if global_left else idle_settings["LeftIKTargetBoneName"],
-                    "RightIKTargetBoneName": global_right if global_right else idle_settings["RightIKTargetBoneName"],
-                    "Layers": {
-                        "$id": layer_id,
-                        "$values": layer_values
-                    }
-                })
-                id_counter += 2 + len(layer_anims)
-                self.log_message.emit(f"Processed additive mapping: {map_key} -> {final_name}")
-
-            # Process normal animations.
-            for norm_anim in normal_anims:
-                base_name = os.path.basename(norm_anim)
-                output_name = os.path.splitext(base_name)[0]
-                settings = self.config.get("file_settings", {}).get(norm_anim, DEFAULT_SETTINGS.copy())
-                entry_id = str(id_counter)
-                layer_id = str(id_counter + 1)
-                layer_entry = {
-                    "$id": str(id_counter + 2),
-                    "Owner": {"$ref": entry_id},
-                    "Name": norm_anim,
-                    "Offset": None,
-                    "Color": random.randint(10000000, 99999999),
-                    "Type": 0
-                }
-                anim_entry = {
-                    "$id": entry_id,
-                    "OutputFramerate": settings["OutputFramerate"],
-                    "Name": idle,
-                    "OutputName": output_name,
-                    "OutputFolder": output_path,
-                    "SkeletonPath": skel,
-                    "EnableLeftHandIK": settings["EnableLeftHandIK"],
-                    "EnableRightHandIK": settings["EnableRightHandIK"],
-                    "UseExperimentalFeatures": settings["UseExperimentalFeatures"],
-                    "LeftHandPoseFile": left,
-                    "RightHandPoseFile": right,
-                    "LeftIKTargetBoneName": global_left if global_left else settings["LeftIKTargetBoneName"],
-                    "RightIKTargetBoneName": global_right if global_right else settings["RightIKTargetBoneName"],
-                    "Layers": {
-                        "$id": layer_id,
-                        "$values": [layer_entry]
-                    }
-                }
-                anim_entries.append(anim_entry)
-                id_counter += 3
-                self.log_message.emit(f"Processed normal animation: {norm_anim}")
-
-            if not anim_entries:
-                anim_entries.append({
-                    "$id": str(id_counter),
-                    "OutputFramerate": idle_settings["OutputFramerate"],
-                    "Name": idle,
-                    "OutputName": os.path.splitext(os.path.basename(idle))[0],
-                    "OutputFolder": output_path,
-                    "SkeletonPath": skel,
-                    "EnableLeftHandIK": idle_settings["EnableLeftHandIK"],
-                    "EnableRightHandIK": idle_settings["EnableRightHandIK"],
-                    "UseExperimentalFeatures": idle_settings["UseExperimentalFeatures"],
-                    "LeftHandPoseFile": left,
-                    "RightHandPoseFile": right,
-                    "LeftIKTargetBoneName": global_left if global_left else idle_settings["LeftIKTargetBoneName"],
-                    "RightIKTargetBoneName": global_right if global_right else idle_settings["RightIKTargetBoneName"],
-                    "Layers": {
-                        "$id": str(id_counter + 1),
-                        "$values": []
-                    }
-                })
-                self.log_message.emit("No animation entries processed; using idle animation only.")
-
-            self.progress_changed.emit(60)
-            project = {
-                "$id": "1",
-                "EnableAnimationTrimming": False,
-                "LeftIKStartBoneName": "j_shoulder_le",
-                "LeftIKMidBoneName": "j_elbow_le",
-                "LeftIKEndBoneName": "j_wrist_le",
-                "LeftIKTargetBoneName": idle_settings["LeftIKTargetBoneName"],
-                "RightIKStartBoneName": "j_shoulder_ri",
-                "RightIKMidBoneName": "j_elbow_ri",
-                "RightIKEndBoneName": "j_wrist_ri",
-                "RightIKTargetBoneName": idle_settings["RightIKTargetBoneName"],
-                "OutputPrefix": "",
-                "OutputSuffix": "",
-                "OutputFormat": ".seanim",
-                "Animations": {
-                    "$id": "2",
-                    "$values": anim_entries
-                }
-            }
+            # Settings are only read here, so DEFAULT_SETTINGS is shared rather than copied.
+            file_settings = config.get("file_settings", {})
+            idle_settings = file_settings.get(idle, DEFAULT_SETTINGS)
+            log(f"Idle settings loaded: {idle_settings}")
+
+            # Basenames are computed once, and fragment lookups are memoized since the
+            # same fragment (e.g. walk_offset_additive) is shared by many mappings.
+            anim_basenames = [(_basename(a), a) for a in anims]
+            fragment_matches: Dict[str, Any] = {}
+            # Bound method of a private generator for the per-layer random colors.
+            randrange = random.Random().randrange
+            # The idle file name (without extension) names the project file, and its
+            # prefix names every additive entry.
+            idle_stem = file_stem(idle)
+            head, sep, _ = idle_stem.rpartition("_")
+            idle_prefix = head if sep else idle_stem
+            # Additive entries, the idle-only fallback and the project header all use the
+            # idle settings; read them once up front.
+            idle_framerate = idle_settings["OutputFramerate"]
+            idle_left_ik = idle_settings["EnableLeftHandIK"]
+            idle_right_ik = idle_settings["EnableRightHandIK"]
+            idle_experimental = idle_settings["UseExperimentalFeatures"]
+            idle_left_bone = idle_settings["LeftIKTargetBoneName"]
+            idle_right_bone = idle_settings["RightIKTargetBoneName"]
+            idle_left_target = global_left or idle_left_bone
+            idle_right_target = global_right or idle_right_bone
+
+            project = PROJECT_TEMPLATE.copy()
+            project["LeftIKTargetBoneName"] = idle_left_bone
+            project["RightIKTargetBoneName"] = idle_right_bone
+            # The animation entries are streamed into the empty "$values" list, which is
+            # the last thing in the serialized project.
+            prefix, _, suffix = dump_json_compact(project).rpartition(b"[]")
 
             project_folder = os.path.join(os.path.dirname(__file__), "Projects")
-            os.makedirs(project_folder, exist_ok=True)
-            out_name = os.path.splitext(os.path.basename(idle))[0]
-            out_path = os.path.join(project_folder, f"{out_name}.aprj")
-            with open(out_path, "w") as f:
-                json.dump(project, f, indent=4)
-
-            self.progress_changed.emit(100)
-            self.log_message.emit(f"Project file saved: {out_path}")
+            if project_folder not in ProjectCreator._ensured_dirs:
+                os.makedirs(project_folder, exist_ok=True)
+                ProjectCreator._ensured_dirs.add(project_folder)
+            out_path = os.path.join(project_folder, f"{idle_stem}.aprj")
+
+            total = len(mappings) + len(normal_anims)
+            processed = 0
+            last_progress = 10
+            entry_count = 0
+            # Encoded entries are appended to an in-memory buffer that is handed to
+            # os.write whenever it reaches PROJECT_WRITE_CHUNK bytes, so a typical project
+            # is written in one syscall and memory stays bounded for large ones. The entries
+            # go to a temporary file that only replaces out_path once the project is complete,
+            # so a failed run leaves the previous project untouched.
+            buffer = io.BytesIO()
+            buffer.write(prefix + b"[")
+            tmp_path = out_path + ".tmp"
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            try:
+                fd = os.open(tmp_path, flags, 0o644)
+            except FileNotFoundError:
+                # The Projects folder was removed after it was created; create it again.
+                ProjectCreator._ensured_dirs.discard(project_folder)
+                os.makedirs(project_folder, exist_ok=True)
+                ProjectCreator._ensured_dirs.add(project_folder)
+                fd = os.open(tmp_path, flags, 0o644)
+            try:
+                def flush_buffer() -> None:
+                    with buffer.getbuffer() as view:
+                        write_fd(fd, view)
+                    buffer.seek(0)
+                    buffer.truncate()
+
+                def write_entry(entry: Dict[str, Any]) -> None:
+                    nonlocal entry_count
+                    if entry_count:
+                        buffer.write(b",")
+                    buffer.write(dump_json_compact(entry))
+                    entry_count += 1
+                    if buffer.tell() >= PROJECT_WRITE_CHUNK:
+                        flush_buffer()
+
+                def step_progress() -> None:
+                    nonlocal processed, last_progress
+                    processed += 1
+                    progress = 10 + 50 * processed // total
+                    if progress != last_progress:
+                        emit_progress(progress)
+                        last_progress = progress
+
+                # Process mappings for additive animations.
+                for map_key, values in mappings.items():
+                    step_progress()
+                    output_name = values[0]
+                    types = values[1:]
+                    fragments = map_key.split(",")
+                    layer_anims = []
+                    found_all = True
+
+                    for frag in fragments:
+                        if frag not in fragment_matches:
+                            fragment_matches[frag] = next((a for bn, a in anim_basenames if frag in bn), None)
+                        match = fragment_matches[frag]
+                        if match is not None:
+                            layer_anims.append(match)
+                        else:
+                            found_all = False
+                            break
+
+                    if not found_all:
+                        continue
+
+                    final_name = f"{idle_prefix}_{output_name}"
+                    entry_id = str(id_counter)
+                    layer_id = str(id_counter + 1)
+
+                    layer_values = []
+                    for idx, anim_path in enumerate(layer_anims):
+                        layer_values.append({
+                            "$id": str(id_counter + 2 + idx),
+                            "Owner": {"$ref": entry_id},
+                            "Name": anim_path,
+                            "Offset": None,
+                            "Color": randrange(10000000, 100000000),
+                            "Type": types[idx] if idx < len(types) else types[-1]
+                        })
+
+                    write_entry({
+                        "$id": entry_id,
+                        "OutputFramerate": idle_framerate,
+                        "Name": idle,
+                        "OutputName": final_name,
+                        "OutputFolder": output_path,
+                        "SkeletonPath": skel,
+                        "EnableLeftHandIK": idle_left_ik,
+                        "EnableRightHandIK": idle_right_ik,
+                        "UseExperimentalFeatures": idle_experimental,
+                        "LeftHandPoseFile": left,
+                        "RightHandPoseFile": right,
+                        "LeftIKTargetBoneName": idle_left_target,
+                        "RightIKTargetBoneName": idle_right_target,
+                        "Layers": {
+                            "$id": layer_id,
+                            "$values": layer_values
+                        }
+                    })
+                    id_counter += 2 + len(layer_anims)
+                    log(f"Processed additive mapping: {map_key} -> {final_name}")
+
+                # Process normal animations.
+                normal_entries = iter_normal_entries(
+                    normal_anims, file_settings, idle, output_path, skel, left, right,
+                    global_left, global_right, id_counter, randrange)
+                for norm_anim, entry in zip(normal_anims, normal_entries):
+                    step_progress()
+                    write_entry(entry)
+                    log(f"Processed normal animation: {norm_anim}")
+                id_counter += 3 * len(normal_anims)
+
+                if not entry_count:
+                    write_entry({
+                        "$id": str(id_counter),
+                        "OutputFramerate": idle_framerate,
+                        "Name": idle,
+                        "OutputName": idle_stem,
+                        "OutputFolder": output_path,
+                        "SkeletonPath": skel,
+                        "EnableLeftHandIK": idle_left_ik,
+                        "EnableRightHandIK": idle_right_ik,
+                        "UseExperimentalFeatures": idle_experimental,
+                        "LeftHandPoseFile": left,
+                        "RightHandPoseFile": right,
+                        "LeftIKTargetBoneName": idle_left_target,
+                        "RightIKTargetBoneName": idle_right_target,
+                        "Layers": {
+                            "$id": str(id_counter + 1),
+                            "$values": []
+                        }
+                    })
+                    log("No animation entries processed; using idle animation only.")
+
+                buffer.write(b"]" + suffix)
+                flush_buffer()
+            except BaseException:
+                os.close(fd)
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            os.close(fd)
+            os.replace(tmp_path, out_path)
+
+            emit_progress(100)
+            log(f"Project file saved: {out_path}")
+            self._flush_log()
             self.project_created.emit(out_path)
         except Exception as e:
+            self._flush_log()
             err_msg = f"Error creating project: {e}\n{traceback.format_exc()}"
             self.error_occurred.emit(err_msg)
             self.log_message.emit(err_msg)
+        finally:
+            self._flush_log()
 
 
 ###############################################################################
@@ -759,12 +1322,19 @@ class AlchemistAdditiveApp(QMainWindow):
         self.setStatusBar(QStatusBar())
         self.init_menu()
         self.init_ui()
-        self.populate_fields()
+        # Restoring saved fields touches the filesystem, so it runs once the event loop
+        # has started and the window is already on screen.
+        QTimer.singleShot(0, self.populate_fields)
 
     def init_menu(self) -> None:
         menubar = self.menuBar()
 
         file_menu = menubar.addMenu("File")
+        export_config_action = QAction("Export Configuration as JSON...", self)
+        export_config_action.triggered.connect(self.export_configuration)
+        export_config_action.setToolTip("Save the current configuration to a readable JSON file.")
+        file_menu.addAction(export_config_action)
+
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         exit_action.setToolTip("Exit the application.")
@@ -788,11 +1358,12 @@ class AlchemistAdditiveApp(QMainWindow):
         help_menu.addAction(about_action)
 
     def init_ui(self) -> None:
+        cfg = self.config_manager.config
         central_widget = QWidget()
         main_layout = QVBoxLayout()
 
         # Output path selector.
-        self.output_selector = OutputPathSelector(self.config_manager.config.get("output_path", ""), self.update_config)
+        self.output_selector = OutputPathSelector(cfg.get("output_path", ""), self.update_config)
         main_layout.addWidget(self.output_selector)
 
         # ---------------------------------------------------------------------------
@@ -803,7 +1374,8 @@ class AlchemistAdditiveApp(QMainWindow):
         left_ik_label = QLabel("Left IK Global Override")
         self.left_ik_text = QLineEdit()
         self.left_ik_text.setToolTip("Enter a global override for Left IK Target Bone Name.")
-        self.left_ik_text.textChanged.connect(lambda text: self.update_config("LeftIKTargetBoneName", text))
+        self.left_ik_text.editingFinished.connect(
+            lambda: self.on_ik_override_edited("LeftIKTargetBoneName", self.left_ik_text.text()))
         left_ik_layout.addWidget(left_ik_label)
         left_ik_layout.addWidget(self.left_ik_text)
 
@@ -811,7 +1383,8 @@ class AlchemistAdditiveApp(QMainWindow):
         right_ik_label = QLabel("Right IK Global Override")
         self.right_ik_text = QLineEdit()
         self.right_ik_text.setToolTip("Enter a global override for Right IK Target Bone Name.")
-        self.right_ik_text.textChanged.connect(lambda text: self.update_config("RightIKTargetBoneName", text))
+        self.right_ik_text.editingFinished.connect(
+            lambda: self.on_ik_override_edited("RightIKTargetBoneName", self.right_ik_text.text()))
         right_ik_layout.addWidget(right_ik_label)
         right_ik_layout.addWidget(self.right_ik_text)
 
@@ -826,7 +1399,8 @@ class AlchemistAdditiveApp(QMainWindow):
         self.left_box = DragDropBox("seanim", "left_pose", self.update_config, "Drag Left Pose File \n(.seanim)")
         self.right_box = DragDropBox("seanim", "right_pose", self.update_config, "Drag Right Pose File \n(.seanim)")
         self.skel_box = DragDropBox("semodel", "skeleton", self.update_config, "Drag Skeleton File \n(.semodel)")
-        for box in [self.idle_box, self.skel_box, self.left_box, self.right_box]:
+        self._file_boxes = (self.idle_box, self.skel_box, self.left_box, self.right_box)
+        for box in self._file_boxes:
             h_layout.addWidget(box)
         main_layout.addLayout(h_layout)
 
@@ -835,14 +1409,14 @@ class AlchemistAdditiveApp(QMainWindow):
         additive_vlayout = QVBoxLayout()
         additive_label = QLabel("Additive Animations")
         additive_label.setStyleSheet("color: #aaa; font-size: 10pt;")
-        initial_anims = self.config_manager.config.get("animations", [])
+        initial_anims = cfg.get("animations", [])
         self.anim_drop_area = AnimationDropArea(self.update_config, initial_anims)
         additive_vlayout.addWidget(additive_label)
         additive_vlayout.addWidget(self.anim_drop_area)
         normal_vlayout = QVBoxLayout()
         normal_label = QLabel("Normal Animations")
         normal_label.setStyleSheet("color: #aaa; font-size: 10pt;")
-        initial_normal_anims = self.config_manager.config.get("normal_anims", [])
+        initial_normal_anims = cfg.get("normal_anims", [])
         self.normal_anim_drop_area = NormalAnimationDropArea(self.update_config, initial_normal_anims)
         normal_vlayout.addWidget(normal_label)
         normal_vlayout.addWidget(self.normal_anim_drop_area)
@@ -868,13 +1442,41 @@ class AlchemistAdditiveApp(QMainWindow):
         self.log_dock = QDockWidget("Log", self)
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # Old lines are dropped so the log's memory and layout cost stay bounded.
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_dock.setWidget(self.log_text)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.log_dock)
 
+        # Messages are buffered and appended in one batch per timer tick.
+        self._log_buffer: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self.flush_log)
+
     def log_message(self, message: str) -> None:
-        """Append a log message to the integrated logging window."""
-        self.log_text.appendPlainText(message)
-        self.statusBar().showMessage(message, 5000)
+        """Queue a log message for the integrated logging window."""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        # Worker messages can arrive pre-joined; show only the newest line.
+        self.statusBar().showMessage(self._log_buffer[-1].rpartition("\n")[2], 5000)
+        self._log_buffer.clear()
+
+    def export_configuration(self) -> None:
+        self.commit_ik_overrides()
+        fname, _ = QFileDialog.getSaveFileName(self, "Export Configuration", "", "JSON Files (*.json)")
+        if fname:
+            try:
+                self.config_manager.export_config(fname)
+                self.log_message(f"Exported configuration to: {fname}")
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to export configuration: {e}")
 
     def open_mapping_editor(self) -> None:
         dialog = MappingEditorDialog(self.config_manager, self)
@@ -891,23 +1493,37 @@ class AlchemistAdditiveApp(QMainWindow):
         )
         self.log_message("Displayed About information.")
 
+    def commit_ik_overrides(self) -> None:
+        # editingFinished is not emitted when focus moves to a menu, so store overrides
+        # that were typed but not confirmed before the config is read.
+        self.on_ik_override_edited("LeftIKTargetBoneName", self.left_ik_text.text())
+        self.on_ik_override_edited("RightIKTargetBoneName", self.right_ik_text.text())
+
+    def on_ik_override_edited(self, key: str, text: str) -> None:
+        # editingFinished also fires on focus-out without edits; only save real changes.
+        if self.config_manager.config.get(key, "") != text:
+            self.update_config(key, text)
+
     def update_config(self, key: str, value: Any) -> None:
         """Update configuration, save it, and log the change."""
-        self.config_manager.config[key] = value
-        self.config_manager.save_config()
+        self.config_manager.record_change(key, value)
         self.log_message(f"Configuration updated: {key} -> {value}")
 
     def populate_fields(self) -> None:
-        for box in [self.idle_box, self.skel_box, self.left_box, self.right_box]:
-            saved_path = self.config_manager.config.get(box.config_key)
-            if saved_path and os.path.exists(saved_path):
+        boxes = self._file_boxes
+        saved_paths = [self.config_manager.config.get(box.config_key) for box in boxes]
+        existing = existing_files(path for path in saved_paths if path)
+        for box, saved_path in zip(boxes, saved_paths):
+            if saved_path in existing:
                 box.set_filename_display(os.path.basename(saved_path))
                 self.log_message(f"Populated field {box.config_key}: {saved_path}")
-        # Set the global IK override fields if already defined.
+        # Set the global IK override fields if already defined. Signals are blocked so
+        # restoring saved values is not treated as a user edit.
         left_override = self.config_manager.config.get("LeftIKTargetBoneName", "")
         right_override = self.config_manager.config.get("RightIKTargetBoneName", "")
-        self.left_ik_text.setText(left_override)
-        self.right_ik_text.setText(right_override)
+        with QSignalBlocker(self.left_ik_text), QSignalBlocker(self.right_ik_text):
+            self.left_ik_text.setText(left_override)
+            self.right_ik_text.setText(right_override)
 
     def on_animation_item_clicked(self, file_path: str) -> None:
         self.selected_anim_file = file_path
@@ -922,21 +1538,30 @@ class AlchemistAdditiveApp(QMainWindow):
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            if os.path.exists(CONFIG_FILE):
-                try:
-                    os.remove(CONFIG_FILE)
-                    self.log_message("Configuration file removed.")
-                except Exception as e:
-                    self.log_message(f"Error resetting configuration: {e}")
+            self.config_manager.discard_pending_changes()
+            manager = self.config_manager
+            for path in (manager.config_file, manager.config_pack_file, manager.config_log_file):
+                if os.path.exists(path):
+                    try:
+                        os.remove(path)
+                        self.log_message(f"Configuration file removed: {path}")
+                    except Exception as e:
+                        self.log_message(f"Error resetting configuration: {e}")
             self.config_manager.config = {"file_settings": {}}
-            self.output_selector.edit.clear()
-            for box in [self.idle_box, self.skel_box, self.left_box, self.right_box]:
+            # Clearing the fields must not write the emptied values back to the config.
+            with QSignalBlocker(self.output_selector.edit), QSignalBlocker(self.left_ik_text), \
+                    QSignalBlocker(self.right_ik_text):
+                self.output_selector.edit.clear()
+                self.left_ik_text.clear()
+                self.right_ik_text.clear()
+            for box in self._file_boxes:
                 box.set_placeholder()
-            self.anim_drop_area.list_widget.clear()
-            self.normal_anim_drop_area.list_widget.clear()
+            self.anim_drop_area.clear_files()
+            self.normal_anim_drop_area.clear_files()
             self.log_message("Configuration reset.")
 
     def create_project_file(self) -> None:
+        self.commit_ik_overrides()
         self.prog_dialog = QProgressDialog("Please wait while the project file is being created...", "Cancel", 0, 100, self)
         self.prog_dialog.setWindowTitle("Creating Project")
         self.prog_dialog.setWindowModality(Qt.WindowModal)
@@ -970,8 +1595,12 @@ class AlchemistAdditiveApp(QMainWindow):
 
 def main() -> None:
     app = QApplication(sys.argv)
+    # qtmodern is only needed once the application exists, so it is imported here.
+    import qtmodern.styles
+    import qtmodern.windows
     qtmodern.styles.dark(app)
     window = AlchemistAdditiveApp()
+    app.aboutToQuit.connect(window.config_manager.close)
     modern_window = qtmodern.windows.ModernWindow(window)
     modern_window.show()
     sys.exit(app.exec_())